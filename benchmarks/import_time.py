@@ -0,0 +1,62 @@
+"""Enforces the import-time budget of reverb.
+
+Every target is imported in a fresh interpreter with `-X importtime`, the best of several runs is
+compared against its budget and the process exits with a non-zero status when a budget is exceeded
+or a networking module is imported eagerly.
+
+Run with `python benchmarks/import_time.py [runs]`.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+BUDGETS_MS: dict[str, float] = {
+    "reverb": 30.0,
+    "reverb.models": 120.0,
+}
+"""Import-time budget of every target in milliseconds, including its dependencies."""
+
+FORBIDDEN_MODULES: tuple[str, ...] = ("aiohttp", "hikari", "reverb.client", "reverb.gateway", "reverb.rest")
+"""Modules that importing any of the targets must not pull in."""
+
+
+def _import_time_ms(target: str) -> float:
+    # only the lines of the target and its parent packages count, the other top-level lines are
+    # interpreter startup (site, encodings, io, ...). `import reverb.models` imports `reverb` first
+    # as a separate top-level line, so a parent's time is part of importing the target.
+    modules = {".".join(target.split(".")[: index + 1]) for index in range(target.count(".") + 1)}
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"], capture_output=True, text=True, check=True
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() in modules and not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total / 1000
+
+
+def _eager_modules(target: str) -> list[str]:
+    code = f"import sys, {target}; print(*(m for m in {FORBIDDEN_MODULES!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+
+def main(runs: int) -> int:
+    failed = False
+    for target, budget in BUDGETS_MS.items():
+        best = min(_import_time_ms(target) for _ in range(runs))
+        eager = _eager_modules(target)
+        ok = best <= budget and not eager
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} import {target:<14} {best:7.1f}ms (budget {budget:.0f}ms)")
+        if eager:
+            print(f"     eagerly imports {', '.join(eager)}")
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,75 @@
+"""Reports the retained memory of the models built for high-frequency gateway payloads.
+
+Run with `python benchmarks/memory.py [guilds]`.
+"""
+
+from __future__ import annotations
+
+import base64
+import gc
+import sys
+import tracemalloc
+import typing
+
+from reverb.models import PlayerUpdateOP, TrackEndEventOP, TrackExceptionEventOP
+
+TRACKS = 500
+"""Number of distinct tracks shared by the simulated guilds."""
+
+
+def _encoded_track(index: int) -> str:
+    # roughly the size of a real lavaplayer track blob.
+    return base64.b64encode(f"track-{index}".encode().ljust(180, b"\0")).decode()
+
+
+def _measure(factory: typing.Callable[[int], typing.Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    retained = [factory(index) for index in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return current / count
+
+
+def main(guilds: int) -> None:
+    # payloads are decoded from fresh json text on every frame, so every string is a new object.
+    def player(index: int) -> PlayerUpdateOP:
+        return PlayerUpdateOP.create(
+            {
+                "op": "playerUpdate",
+                "guildId": str(10**17 + index),
+                "state": {"time": 1_700_000_000_000 + index, "position": index * 20, "connected": True, "ping": 42},
+            }
+        )
+
+    def track_end(index: int) -> TrackEndEventOP:
+        return TrackEndEventOP.create(
+            {
+                "op": "event",
+                "type": "TrackEndEvent",
+                "guildId": str(10**17 + index),
+                "encodedTrack": _encoded_track(index % TRACKS),
+                "reason": "FINISHED",
+            }
+        )
+
+    def track_exception(index: int) -> TrackExceptionEventOP:
+        return TrackExceptionEventOP.create(
+            {
+                "op": "event",
+                "type": "TrackExceptionEvent",
+                "guildId": str(10**17 + index),
+                "encodedTrack": _encoded_track(index % TRACKS),
+                "exception": {"message": "".join("Video unavailable"), "severity": "COMMON", "cause": "".join("x")},
+            }
+        )
+
+    print(f"python {sys.version.split()[0]}, {guilds} guilds, {TRACKS} distinct tracks")
+    print(f"PlayerUpdateOP        {_measure(player, guilds):8.1f} bytes per cached player")
+    print(f"TrackEndEventOP       {_measure(track_end, guilds):8.1f} bytes per event")
+    print(f"TrackExceptionEventOP {_measure(track_exception, guilds):8.1f} bytes per event")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
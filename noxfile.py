@@ -25,3 +25,13 @@ def run_black(session: nox.Session) -> None:
 @with_poetry("isort")
 def run_isort(session: nox.Session) -> None:
     session.run("poetry", "run", "python", "-m", "isort", *CODE_PATHS, external=True)
+
+
+@with_poetry()
+def benchmark_memory(session: nox.Session) -> None:
+    session.run("poetry", "run", "python", "benchmarks/memory.py", *session.posargs, external=True)
+
+
+@with_poetry()
+def benchmark_import_time(session: nox.Session) -> None:
+    session.run("poetry", "run", "python", "benchmarks/import_time.py", *session.posargs, external=True)
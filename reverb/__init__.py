@@ -1,22 +1,32 @@
 """
 A Lavalink library for the discord API wrapper, hikari.
+
+The networking modules (and with them aiohttp and hikari) are only imported when one of their
+attributes is first accessed, so `reverb.models` and `reverb.enums` stay cheap to import.
 """
 
 from __future__ import annotations
 
-from .client import LavalinkClient
+import importlib
+import typing
+
 from .enums import ExceptionSeverity, TrackEndReason
-from .events import (
-    DiscordWebsocketClosedEvent,
-    LavalinkReadyEvent,
-    PlayerUpdateEvent,
-    ReverbEvent,
-    StatsEvent,
-    TrackEndEvent,
-    TrackExceptionEvent,
-    TrackStartEvent,
-    TrackStuckEvent,
-)
+
+if typing.TYPE_CHECKING:
+    from .client import LavalinkClient
+    from .events import (
+        DiscordWebsocketClosedEvent,
+        LavalinkReadyEvent,
+        PlayerUpdateEvent,
+        ReverbEvent,
+        StatsEvent,
+        TrackEndEvent,
+        TrackExceptionEvent,
+        TrackStartEvent,
+        TrackStuckEvent,
+    )
+    from .recorder import GatewayRecorder, GatewayReplayer
+    from .router import GuildEventRouter
 
 __all__: tuple[str, ...] = (
     # client.py
@@ -31,9 +41,46 @@ __all__: tuple[str, ...] = (
     "TrackEndEvent",
     "TrackExceptionEvent",
     "DiscordWebsocketClosedEvent",
+    # recorder.py
+    "GatewayRecorder",
+    "GatewayReplayer",
+    # router.py
+    "GuildEventRouter",
     # enums.py
     "ExceptionSeverity",
     "TrackEndReason",
 )
 
 __version__ = "0.0.1a"
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "LavalinkClient": "client",
+    "LavalinkReadyEvent": "events",
+    "ReverbEvent": "events",
+    "PlayerUpdateEvent": "events",
+    "StatsEvent": "events",
+    "TrackStartEvent": "events",
+    "TrackStuckEvent": "events",
+    "TrackEndEvent": "events",
+    "TrackExceptionEvent": "events",
+    "DiscordWebsocketClosedEvent": "events",
+    "GatewayRecorder": "recorder",
+    "GatewayReplayer": "recorder",
+    "GuildEventRouter": "router",
+}
+
+_LAZY_SUBMODULES: tuple[str, ...] = ("client", "events", "gateway", "rest", "models", "recorder", "router")
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if (module := _LAZY_ATTRIBUTES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_SUBMODULES})
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import typing
 
 import aiohttp
 import attrs
 import hikari
 
-from reverb.gateway import GatewayHandler
+from reverb.gateway import GatewayHandler, validate_heartbeat
 from reverb.rest import RESTClient
+from reverb.router import GuildEventRouter
 
 if typing.TYPE_CHECKING:
     from reverb import models
+    from reverb.recorder import GatewayRecorder
+
+GuildsOrPredicate = typing.Union[typing.Iterable[int], typing.Callable[[int], bool]]
+"""Either an iterable of guild IDs or a predicate called with the guild ID of every player on the session."""
 
 
 @attrs.define(kw_only=True, slots=True)
@@ -70,7 +76,10 @@ class LavalinkClient:
     """ID of your bot application."""
     bot: hikari.UndefinedOr[hikari.GatewayBot]
     """Your hikari bot's instance, this is needed to dispatch the lavalink events."""
+    router: GuildEventRouter = attrs.field(init=False, factory=GuildEventRouter)
+    """Router for handlers listening to the events of a single guild."""
     _server_version: str | None = attrs.field(init=False, default=None)
+    _session_id: str | None = attrs.field(init=False, default=None)
     _rest: hikari.UndefinedOr[RESTClient] = attrs.field(init=False, default=hikari.UNDEFINED)
     _gateway: hikari.UndefinedOr[GatewayHandler] = attrs.field(init=False, default=hikari.UNDEFINED)
     _client_session: hikari.UndefinedOr[aiohttp.ClientSession] = attrs.field(init=False, default=hikari.UNDEFINED)
@@ -112,6 +121,27 @@ class LavalinkClient:
         assert isinstance(self._server_version, str)
         return self._server_version
 
+    @property
+    def session_id(self) -> str:
+        """
+        Returns
+        -------
+            str
+            The session ID received in the ready payload from the server.
+        """
+        assert isinstance(self._session_id, str), "session not ready yet, wait for the LavalinkReadyEvent"
+        return self._session_id
+
+    @property
+    def latency(self) -> float:
+        """
+        Returns
+        -------
+            float
+            Rolling average of the gateway round trip in seconds, `nan` until the first heartbeat is acknowledged.
+        """
+        return self.gateway.latency
+
     @classmethod
     async def build(
         cls,
@@ -122,6 +152,9 @@ class LavalinkClient:
         application_id: int,
         bot: hikari.UndefinedOr[hikari.GatewayBot] = hikari.UNDEFINED,
         client_session: hikari.UndefinedOr[aiohttp.ClientSession] = hikari.UNDEFINED,
+        recorder: GatewayRecorder | None = None,
+        heartbeat_interval: float | None = 30.0,
+        heartbeat_timeout: float = 10.0,
     ) -> LavalinkClient:
         """Initialises a LavalinkClient class.
 
@@ -139,6 +172,12 @@ class LavalinkClient:
             The hikari bot instance.
         client_session: aiohttp.ClientSession
             The custom clientsession class to use, if any.
+        recorder: reverb.recorder.GatewayRecorder | None
+            Recorder to write the raw gateway frames to, if any.
+        heartbeat_interval: float | None
+            Seconds between gateway pings, `None` disables the heartbeat.
+        heartbeat_timeout: float
+            Seconds to wait for a pong before the gateway connection is considered dead.
 
         Returns
         -------
@@ -146,6 +185,7 @@ class LavalinkClient:
             The lavalink client that was initialised.
 
         """
+        validate_heartbeat(heartbeat_interval, heartbeat_timeout)
         inst = cls(
             host=host if host.startswith("http") else f"http://{host}",
             port=int(port),
@@ -157,7 +197,13 @@ class LavalinkClient:
         inst._client_session = (
             client_session if isinstance(client_session, aiohttp.ClientSession) else aiohttp.ClientSession()
         )
-        inst._gateway = GatewayHandler(client=inst, client_session=inst.client_session)
+        inst._gateway = GatewayHandler(
+            client=inst,
+            client_session=inst.client_session,
+            recorder=recorder,
+            heartbeat_interval=heartbeat_interval,
+            heartbeat_timeout=heartbeat_timeout,
+        )
         inst._rest = RESTClient(client=inst)
         await inst.gateway.connect()
         inst._server_version = await inst.rest.get_version()
@@ -171,3 +217,120 @@ class LavalinkClient:
 
     def get_stats(self) -> typing.Awaitable[models.StatsOP]:
         return self.rest.get_stats()
+
+    def update_player(self, guild_id: int, data: dict[str, typing.Any]) -> typing.Awaitable[dict[str, typing.Any]]:
+        return self.rest.update_player(guild_id, data)
+
+    async def destroy_player(self, guild_id: int) -> None:
+        """Destroys the player of a guild and removes the guild's handlers from the `router`."""
+        await self.rest.destroy_player(guild_id)
+        self.router.remove_guild(guild_id)
+
+    async def _resolve_guild_ids(self, guilds: GuildsOrPredicate) -> list[int]:
+        if callable(guilds):
+            players = await self.rest.get_players()
+            return [guild_id for guild_id in (int(player["guildId"]) for player in players) if guilds(guild_id)]
+        return list(dict.fromkeys(int(guild_id) for guild_id in guilds))
+
+    async def _run_bulk(
+        self,
+        guilds: GuildsOrPredicate,
+        callback: typing.Callable[[int], typing.Awaitable[typing.Any]],
+        concurrency: int,
+        timeout: float | None,
+    ) -> dict[int, typing.Any]:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        guild_ids = await self._resolve_guild_ids(guilds)
+        if not guild_ids:
+            return {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(guild_id: int) -> typing.Any:
+            async with semaphore:
+                return await callback(guild_id)
+
+        tasks = {guild_id: asyncio.ensure_future(run(guild_id)) for guild_id in guild_ids}
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        finally:
+            # also reached when the caller cancels us, the tasks must not outlive the bulk call.
+            unfinished = [task for task in tasks.values() if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+        results: dict[int, typing.Any] = {}
+        for guild_id, task in tasks.items():
+            if task in pending:
+                results[guild_id] = asyncio.TimeoutError(f"guild {guild_id} did not finish within {timeout}s")
+            elif task.cancelled():
+                results[guild_id] = asyncio.CancelledError(f"request for guild {guild_id} was cancelled")
+            else:
+                results[guild_id] = task.exception() or task.result()
+        return results
+
+    async def bulk_update_players(
+        self,
+        guilds: GuildsOrPredicate,
+        data: dict[str, typing.Any],
+        *,
+        concurrency: int = 50,
+        timeout: float | None = None,
+    ) -> dict[int, typing.Any]:
+        """Applies the same player update to many guilds, with at most `concurrency` requests in flight.
+
+        Parameters
+        ----------
+        guilds: GuildsOrPredicate
+            Guild IDs to update, or a predicate to filter the players present on the session.
+        data: dict[str, typing.Any]
+            The update player payload, e.g. `{"paused": True}` or `{"volume": 50}`.
+        concurrency: int
+            Maximum number of concurrent requests.
+        timeout: float | None
+            Seconds to wait for all the guilds, the ones still running afterwards are cancelled.
+
+        Returns
+        -------
+            dict[int, typing.Any]
+            Mapping of guild ID to the updated player payload, or the exception raised for that guild
+            (`aiohttp.ClientResponseError` for a failed request, `asyncio.TimeoutError` past the timeout,
+            `asyncio.CancelledError` if its request was cancelled elsewhere).
+        """
+        return await self._run_bulk(
+            guilds, lambda guild_id: self.rest.update_player(guild_id, data), concurrency, timeout
+        )
+
+    async def bulk_destroy_players(
+        self, guilds: GuildsOrPredicate, *, concurrency: int = 50, timeout: float | None = None
+    ) -> dict[int, typing.Any]:
+        """Destroys the players of many guilds, with at most `concurrency` requests in flight.
+
+        Parameters
+        ----------
+        guilds: GuildsOrPredicate
+            Guild IDs to destroy, or a predicate to filter the players present on the session.
+        concurrency: int
+            Maximum number of concurrent requests.
+        timeout: float | None
+            Seconds to wait for all the guilds, the ones still running afterwards are cancelled.
+
+        Returns
+        -------
+            dict[int, typing.Any]
+            Mapping of guild ID to `None` on success, or the exception raised for that guild
+            (`aiohttp.ClientResponseError` for a failed request, `asyncio.TimeoutError` past the timeout,
+            `asyncio.CancelledError` if its request was cancelled elsewhere).
+            A player that no longer exists on the server counts as destroyed.
+        """
+
+        async def destroy(guild_id: int) -> None:
+            try:
+                await self.destroy_player(guild_id)
+            except aiohttp.ClientResponseError as e:
+                if e.status != 404:
+                    raise
+                self.router.remove_guild(guild_id)
+
+        return await self._run_bulk(guilds, destroy, concurrency, timeout)
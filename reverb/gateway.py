@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import json
 import logging
+import time
 import typing
 
 import aiohttp
@@ -36,12 +38,13 @@ from reverb.models import (
 
 if typing.TYPE_CHECKING:
     from reverb.client import LavalinkClient
+    from reverb.recorder import GatewayRecorder
 
 
 TYPE_TO_EVENT_MAP: dict[str, type[_EventOP]] = {
     "TrackStartEvent": TrackStartEventOP,
     "TrackExceptionEvent": TrackExceptionEventOP,
-    "TrackStuckEvent": TrackStartEventOP,
+    "TrackStuckEvent": TrackStuckEventOP,
     "TrackEndEvent": TrackEndEventOP,
     "WebSocketClosedEvent": DiscordWebsocketClosedEventOP,
 }
@@ -55,11 +58,30 @@ OP_TO_REVERB_EVENT_MAP: dict[type[_EventOP], type[_EventOPEvent]] = {
 }
 
 
+def validate_heartbeat(interval: float | None, timeout: float) -> None:
+    """Raises `ValueError` unless the interval is `None` or positive and the timeout is positive."""
+    if interval is not None and interval <= 0:
+        raise ValueError("heartbeat_interval must be positive or None")
+    if timeout <= 0:
+        raise ValueError("heartbeat_timeout must be positive")
+
+
 @attrs.define(kw_only=True, slots=True)
 class GatewayHandler:
     client: LavalinkClient
     client_session: aiohttp.ClientSession
+    recorder: GatewayRecorder | None = None
+    heartbeat_interval: float | None = 30.0
+    """Seconds between websocket pings, `None` disables the heartbeat."""
+    heartbeat_timeout: float = 10.0
+    """Seconds to wait for a pong before the connection is considered dead and closed."""
     _websocket: hikari.UndefinedOr[aiohttp.ClientWebSocketResponse] = attrs.field(init=False, default=hikari.UNDEFINED)
+    _heartbeat_task: asyncio.Task[None] | None = attrs.field(init=False, default=None)
+    _pong_waiter: asyncio.Future[None] | None = attrs.field(init=False, default=None)
+    _latencies: collections.deque[float] = attrs.field(init=False, factory=lambda: collections.deque(maxlen=10))
+
+    def __attrs_post_init__(self) -> None:
+        validate_heartbeat(self.heartbeat_interval, self.heartbeat_timeout)
 
     @property
     def gw_headers(self) -> dict[str, multidict.istr]:
@@ -76,29 +98,94 @@ class GatewayHandler:
         ), "gateway not connected to the lavalink server yet"
         return self._websocket
 
+    @property
+    def latency(self) -> float:
+        """Rolling average of the websocket ping round trip in seconds, `nan` if no pong was received yet."""
+        if not self._latencies:
+            return float("nan")
+        return sum(self._latencies) / len(self._latencies)
+
     async def process_events(self, payload: dict[str, typing.Any]) -> None:
         op = OPTypes(payload["op"])
         logging.debug("Recieved %s event from server", op)
 
+        if op is OPTypes.READY:
+            self.client._session_id = payload["sessionId"]
+
         if not isinstance((bot := self.client.bot), hikari.GatewayBot):
             return
         if op is OPTypes.READY:
             bot.dispatch(LavalinkReadyEvent(app=bot, data=ReadyOP.create(payload)))
         elif op is OPTypes.PLAYER_UPDATE:
-            bot.dispatch(PlayerUpdateEvent(app=bot, data=PlayerUpdateOP.create(payload)))
+            player_update = PlayerUpdateOP.create(payload)
+            event = PlayerUpdateEvent(app=bot, data=player_update)
+            bot.dispatch(event)
+            self.client.router.dispatch(player_update.guild_id, event)
         elif op is OPTypes.STATS:
             bot.dispatch(StatsEvent(app=bot, data=StatsOP.create(payload)))
         elif op is OPTypes.EVENT:
-            event_op_class = TYPE_TO_EVENT_MAP[payload["event"]]
-            bot.dispatch(OP_TO_REVERB_EVENT_MAP[event_op_class](app=bot, data=event_op_class.create(payload)))
+            event_op_class = TYPE_TO_EVENT_MAP[payload["type"]]
+            event_op = event_op_class.create(payload)
+            event = OP_TO_REVERB_EVENT_MAP[event_op_class](app=bot, data=event_op)
+            bot.dispatch(event)
+            self.client.router.dispatch(event_op.guild_id, event)
 
     async def _start_listening(self) -> None:
-        async for message in self.websocket:
-            if message.type is aiohttp.WSMsgType.TEXT:  # type: ignore
-                await self.process_events(json.loads(message.data))  # type: ignore
+        try:
+            async for message in self.websocket:
+                if message.type is aiohttp.WSMsgType.TEXT:  # type: ignore
+                    if self.recorder is not None:
+                        self.recorder.record(message.data)  # type: ignore
+                    try:
+                        await self.process_events(json.loads(message.data))  # type: ignore
+                    except Exception:
+                        # e.g. an event type added by a plugin, one bad frame must not end the listener.
+                        logging.exception("Failed to process frame from lavalink, skipping it: %s", message.data)
+                elif message.type is aiohttp.WSMsgType.PING:  # type: ignore
+                    await self.websocket.pong(message.data)  # type: ignore
+                elif message.type is aiohttp.WSMsgType.PONG:  # type: ignore
+                    if self._pong_waiter is not None and not self._pong_waiter.done():
+                        self._pong_waiter.set_result(None)
+        except asyncio.TimeoutError:
+            logging.warning("No data received from lavalink within the receive timeout, closing connection")
+            await self.websocket.close()
+        finally:
+            if self._heartbeat_task is not None:
+                self._heartbeat_task.cancel()
+
+    async def _heartbeat(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while not self.websocket.closed:
+            await asyncio.sleep(interval)
+            self._pong_waiter = loop.create_future()
+            sent = time.perf_counter()
+            try:
+                await self.websocket.ping()
+            except (ConnectionError, aiohttp.ClientError) as e:
+                logging.warning("Failed to ping lavalink, stopping heartbeat: %s", e)
+                return
+            try:
+                await asyncio.wait_for(self._pong_waiter, self.heartbeat_timeout)
+            except asyncio.TimeoutError:
+                logging.warning(
+                    "No pong received from lavalink in %ss, closing dead connection", self.heartbeat_timeout
+                )
+                # detach from the listener so its cleanup doesn't cancel this task mid close handshake.
+                self._heartbeat_task = None
+                await self.websocket.close()
+                return
+            self._latencies.append(time.perf_counter() - sent)
 
     async def connect(self) -> None:
+        # pings and pongs are handled manually to measure the round trip, see `_heartbeat`.
         self._websocket = await self.client_session.ws_connect(  # type: ignore
-            f"{self.client.host}:{self.client.port}/v3/websocket", headers=self.gw_headers
+            f"{self.client.host}:{self.client.port}/v3/websocket",
+            headers=self.gw_headers,
+            autoping=False,
+            receive_timeout=(
+                None if self.heartbeat_interval is None else self.heartbeat_interval + self.heartbeat_timeout
+            ),
         )
         asyncio.create_task(self._start_listening())
+        if self.heartbeat_interval is not None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat(self.heartbeat_interval))
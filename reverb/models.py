@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import sys
 import typing
 
 import attrs
@@ -67,7 +69,7 @@ class StatsOP:
 
 @attrs.define(kw_only=True, slots=True, frozen=True, repr=True)
 class _EventOP:
-    guild_id: int
+    guild_id: int = attrs.field(converter=int)
     type: EventType
 
     @classmethod
@@ -77,29 +79,29 @@ class _EventOP:
 
 @attrs.define(kw_only=True, slots=True, frozen=True, repr=True)
 class TrackStartEventOP(_EventOP):
-    encoded_track: str
+    encoded_track: str = attrs.field(converter=sys.intern)
 
     @classmethod
     def create(cls, payload: dict[str, typing.Any]) -> TrackStartEventOP:
-        return cls(guild_id=int(payload["guildId"]), type=EventType.TRACK_START, encoded_track=payload["encodedTrack"])
+        return cls(guild_id=payload["guildId"], type=EventType.TRACK_START, encoded_track=payload["encodedTrack"])
 
 
 @attrs.define(kw_only=True, slots=True, frozen=True, repr=True)
 class TrackEndEventOP(_EventOP):
-    encoded_track: str
+    encoded_track: str = attrs.field(converter=sys.intern)
     reason: TrackEndReason
 
     @classmethod
     def create(cls, payload: dict[str, typing.Any]) -> TrackEndEventOP:
         return cls(
-            guild_id=int(payload["guildId"]),
+            guild_id=payload["guildId"],
             type=EventType.TRACK_END,
             encoded_track=payload["encodedTrack"],
             reason=TrackEndReason(payload["reason"]),
         )
 
 
-@attrs.define(kw_only=True)
+@attrs.define(kw_only=True, slots=True, frozen=True, repr=True)
 class TrackException:
     message: str | None
     cause: str
@@ -107,14 +109,18 @@ class TrackException:
 
     @classmethod
     def create(cls, payload: dict[str, typing.Any]) -> TrackException:
-        return cls(
-            message=payload.get("message"), cause=payload["cause"], severity=ExceptionSeverity(payload["severity"])
-        )
+        return _create_track_exception(payload.get("message"), payload["cause"], payload["severity"])
+
+
+@functools.lru_cache(maxsize=256)
+def _create_track_exception(message: str | None, cause: str, severity: str) -> TrackException:
+    # the same failure tends to repeat across many guilds, frozen instances can be shared between events.
+    return TrackException(message=message, cause=cause, severity=ExceptionSeverity(severity))
 
 
 @attrs.define(kw_only=True, slots=True, frozen=True, repr=True)
 class TrackExceptionEventOP(_EventOP):
-    encoded_track: str
+    encoded_track: str = attrs.field(converter=sys.intern)
     exception: TrackException
 
     @classmethod
@@ -129,7 +135,7 @@ class TrackExceptionEventOP(_EventOP):
 
 @attrs.define(kw_only=True, slots=True, frozen=True, repr=True)
 class TrackStuckEventOP(_EventOP):
-    encoded_track: str
+    encoded_track: str = attrs.field(converter=sys.intern)
     threshold_ms: int
 
     @classmethod
@@ -155,7 +161,7 @@ class DiscordWebsocketClosedEventOP(_EventOP):
             type=EventType.WEBSOCKET_CLOSED_EVENT,
             code=payload["code"],
             reason=payload["reason"],
-            by_remote=payload["byRmote"],
+            by_remote=payload["byRemote"],
         )
 
 
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import time
+import typing
+
+import attrs
+import hikari
+
+if typing.TYPE_CHECKING:
+    from reverb.gateway import GatewayHandler
+
+FRAME_HEADER = struct.Struct("<QI")
+"""Header written before every frame: nanoseconds since the recorder started and payload length in bytes."""
+
+
+def iter_frames(path: str | os.PathLike[str]) -> typing.Iterator[tuple[int, bytes]]:
+    """Yields `(timestamp_ns, raw_frame)` pairs from a recording file.
+
+    A truncated trailing frame, as left behind by a process killed mid-write, is ignored.
+    """
+    with open(path, "rb") as file:
+        while len(header := file.read(FRAME_HEADER.size)) == FRAME_HEADER.size:
+            timestamp, length = FRAME_HEADER.unpack(header)
+            data = file.read(length)
+            if len(data) != length:
+                return
+            yield timestamp, data
+
+
+@attrs.define(kw_only=True, slots=True)
+class GatewayRecorder:
+    """Appends raw websocket frames received by the gateway to a file.
+
+    Each frame is stored as a fixed size header followed by the raw utf-8 payload.
+    Timestamps are relative to the start of the recorder, so a file can be appended to
+    across several runs and replayed with `GatewayReplayer`.
+
+    ??? example
+        ```py
+        recorder = reverb.GatewayRecorder(path="lavalink.rec")
+        lavalink = await reverb.LavalinkClient.build(..., recorder=recorder)
+        ...
+        recorder.close()
+        ```
+    """
+
+    path: str | os.PathLike[str]
+    """Path of the recording file."""
+    _file: typing.BinaryIO | None = attrs.field(init=False, default=None)
+    _started: int = attrs.field(init=False, factory=time.monotonic_ns)
+    _closed: bool = attrs.field(init=False, default=False)
+
+    def record(self, data: str) -> None:
+        """Appends a single raw frame to the recording, does nothing once the recorder is closed."""
+        if self._closed:
+            return
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        encoded = data.encode("utf-8")
+        self._file.write(FRAME_HEADER.pack(time.monotonic_ns() - self._started, len(encoded)))
+        self._file.write(encoded)
+
+    def close(self) -> None:
+        """Flushes and closes the recording file, frames received afterwards are no longer recorded."""
+        self._closed = True
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@attrs.define(kw_only=True, slots=True)
+class GatewayReplayer:
+    """Feeds a recording made by `GatewayRecorder` back through `GatewayHandler.process_events`.
+
+    No connection to a lavalink server is needed, but the handler's client must have a
+    `hikari.GatewayBot`: without one `process_events` neither parses nor dispatches the frames,
+    so replaying is refused instead of silently doing nothing.
+    """
+
+    gateway: GatewayHandler
+    """The gateway handler to feed the frames to."""
+
+    async def replay(self, path: str | os.PathLike[str], *, speed: float | None = 1.0) -> int:
+        """Replays a recording.
+
+        Parameters
+        ----------
+        path: str | os.PathLike[str]
+            Path of the recording file.
+        speed: float | None
+            Playback speed relative to the original traffic, `None` replays the frames as fast as possible.
+
+        Returns
+        -------
+            int
+            The number of frames processed, frames that failed to process are logged, skipped and not counted.
+
+        Raises
+        ------
+        ValueError
+            If the gateway's client has no bot or `speed` is not positive.
+        """
+        if not isinstance(self.gateway.client.bot, hikari.GatewayBot):
+            raise ValueError("replaying requires a client with a hikari.GatewayBot to parse and dispatch the events")
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive or None")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first_timestamp: int | None = None
+        previous_timestamp = 0
+        count = 0
+        for timestamp, data in iter_frames(path):
+            if speed is not None:
+                # timestamps restart from zero at every run appended to the file.
+                if first_timestamp is None or timestamp < previous_timestamp:
+                    started, first_timestamp = loop.time(), timestamp
+                previous_timestamp = timestamp
+                delay = started + (timestamp - first_timestamp) / 1e9 / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                await self.gateway.process_events(json.loads(data))
+            except Exception:
+                # same handling as the live listener, e.g. for event types added by a plugin.
+                logging.exception("Failed to process recorded frame, skipping it: %s", data)
+                continue
+            count += 1
+        return count
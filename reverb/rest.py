@@ -30,7 +30,7 @@ class Route:
 class RESTClient:
     client: LavalinkClient
 
-    async def request(self, route: Route, json: bool = True) -> typing.Any:
+    async def request(self, route: Route, json: bool = True, raise_for_status: bool = False) -> typing.Any:
         headers: dict[str, multidict.istr] = {"Authorization": multidict.istr(self.client.password)}
         res = await self.client.client_session.request(
             route.method, route.request_url, headers=headers, json=route.data
@@ -38,6 +38,8 @@ class RESTClient:
         try:
             res.raise_for_status()
         except Exception as e:
+            if raise_for_status:
+                raise
             logging.error(e)
         return await res.json() if json is True else await res.content.read()
 
@@ -52,3 +54,18 @@ class RESTClient:
     async def get_info(self) -> LavalinkServerInfo:
         data: dict[str, typing.Any] = await self.request(Route("info", self.client))
         return LavalinkServerInfo.create(data)
+
+    async def get_players(self) -> list[dict[str, typing.Any]]:
+        data: list[dict[str, typing.Any]] = await self.request(
+            Route(f"sessions/{self.client.session_id}/players", self.client), raise_for_status=True
+        )
+        return data
+
+    async def update_player(self, guild_id: int, data: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        route = Route(f"sessions/{self.client.session_id}/players/{guild_id}", self.client, method="PATCH", data=data)
+        player: dict[str, typing.Any] = await self.request(route, raise_for_status=True)
+        return player
+
+    async def destroy_player(self, guild_id: int) -> None:
+        route = Route(f"sessions/{self.client.session_id}/players/{guild_id}", self.client, method="DELETE")
+        await self.request(route, json=False, raise_for_status=True)
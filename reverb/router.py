@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+
+import attrs
+
+if typing.TYPE_CHECKING:
+    from reverb.events import ReverbEvent
+
+EventT = typing.TypeVar("EventT", bound="ReverbEvent")
+CallbackT = typing.Callable[[EventT], typing.Coroutine[typing.Any, typing.Any, None]]
+
+
+@attrs.define(slots=True)
+class GuildEventRouter:
+    """Routes player events to handlers registered for a single guild.
+
+    Unlike listeners added to the bot, a handler here is only called for events of its own guild,
+    and dispatching is a dictionary lookup regardless of how many guilds have handlers.
+    Handlers are matched against the exact event class and are removed once the guild's player is
+    destroyed through the client.
+
+    ??? example
+        ```py
+        async def on_track_end(event: reverb.TrackEndEvent) -> None:
+            ...
+
+        lavalink.router.subscribe(guild_id, reverb.TrackEndEvent, on_track_end)
+        ```
+    """
+
+    _handlers: dict[int, dict[type[ReverbEvent], list[CallbackT[typing.Any]]]] = attrs.field(init=False, factory=dict)
+
+    def subscribe(self, guild_id: int, event_type: type[EventT], callback: CallbackT[EventT]) -> None:
+        """Registers a handler for an event type in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+            ID of the guild to receive events for.
+        event_type: type[reverb.events.ReverbEvent]
+            The event class to receive.
+        callback: typing.Callable[[EventT], typing.Coroutine[typing.Any, typing.Any, None]]
+            The coroutine function to call with the event.
+        """
+        self._handlers.setdefault(int(guild_id), {}).setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, guild_id: int, event_type: type[EventT], callback: CallbackT[EventT]) -> None:
+        """Removes a handler registered with `subscribe`, does nothing if it was not registered."""
+        guild_handlers = self._handlers.get(int(guild_id))
+        if guild_handlers is None or callback not in (callbacks := guild_handlers.get(event_type, [])):
+            return
+        callbacks.remove(callback)
+        if not callbacks:
+            del guild_handlers[event_type]
+        if not guild_handlers:
+            del self._handlers[int(guild_id)]
+
+    def listen(
+        self, guild_id: int, event_type: type[EventT]
+    ) -> typing.Callable[[CallbackT[EventT]], CallbackT[EventT]]:
+        """Decorator version of `subscribe`."""
+
+        def decorator(callback: CallbackT[EventT]) -> CallbackT[EventT]:
+            self.subscribe(guild_id, event_type, callback)
+            return callback
+
+        return decorator
+
+    def remove_guild(self, guild_id: int) -> None:
+        """Removes every handler registered for a guild."""
+        self._handlers.pop(int(guild_id), None)
+
+    def dispatch(self, guild_id: int, event: ReverbEvent) -> asyncio.Future[typing.Any] | None:
+        """Calls the handlers registered for the guild and type of the event.
+
+        Returns
+        -------
+            asyncio.Future[typing.Any] | None
+            Future completing once every handler ran, `None` if no handler was registered.
+        """
+        if (guild_handlers := self._handlers.get(guild_id)) is None:
+            return None
+        if not (callbacks := guild_handlers.get(type(event))):
+            return None
+        return asyncio.gather(*(self._invoke(callback, event) for callback in tuple(callbacks)))
+
+    @staticmethod
+    async def _invoke(callback: CallbackT[typing.Any], event: ReverbEvent) -> None:
+        try:
+            await callback(event)
+        except Exception:
+            logging.exception("Guild handler %r failed to handle %s", callback, type(event).__name__)